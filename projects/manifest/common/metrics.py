@@ -0,0 +1,210 @@
+# manifest/common/metrics.py
+
+import asyncio
+import functools
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+from common.profiler import profiler
+
+# With several uvicorn/gunicorn workers each process keeps its own counters.
+# Point PROMETHEUS_MULTIPROC_DIR at an empty, per-deployment directory (wiped
+# on restart) and prometheus_client writes them to shared mmap files that
+# /metrics aggregates; gunicorn should also call mark_worker_dead from child_exit.
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+# Gate for the profiler routes, which expose internal stack frames
+DEBUG_ENDPOINTS = os.getenv("MANIFEST_DEBUG_ENDPOINTS", "0") == "1"
+
+# Buckets span sub-millisecond cache/regex work up to slow network fetches
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+STAGE_SECONDS = Histogram(
+    "manifest_stage_seconds",
+    "Wall-clock time spent in each instrumented stage.",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_ERRORS = Counter(
+    "manifest_stage_errors_total",
+    "Exceptions raised out of each instrumented stage.",
+    ["stage"],
+)
+BATCH_SIZE = Histogram(
+    "manifest_batch_size",
+    "Number of items handled per batch (chunks embedded, rows inserted, ...).",
+    ["stage"],
+    buckets=SIZE_BUCKETS,
+)
+EVENTS = Counter(
+    "manifest_events_total",
+    "Discrete operational events (fetch outcomes, skips, duplicates).",
+    ["event"],
+)
+CACHE_LOOKUPS = Counter(
+    "manifest_cache_lookups_total",
+    "Cache lookups by outcome (hit, semantic_hit, stale, miss).",
+    ["cache", "result"],
+)
+CACHE_BYTES = Gauge(
+    "manifest_cache_bytes",
+    "Estimated bytes held by each cache.",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+CACHE_ENTRIES = Gauge(
+    "manifest_cache_entries",
+    "Number of entries held by each cache.",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+INGEST_LISTENER_UP = Gauge(
+    "manifest_ingest_listener_up",
+    "1 while the ingestion LISTEN connection is live (search cache enabled), else 0.",
+    multiprocess_mode="livemin",
+)
+HTTP_SECONDS = Histogram(
+    "manifest_http_request_seconds",
+    "FastAPI request latency by route template.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@contextmanager
+def span(stage: str):
+    """Time a block of code and record it under `stage`."""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.labels(stage).inc()
+        raise
+    finally:
+        STAGE_SECONDS.labels(stage).observe(time.perf_counter() - start)
+
+
+def timed(stage: str):
+    """Decorator form of `span`; works on both sync and async callables."""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def count(event: str, amount: int = 1):
+    EVENTS.labels(event).inc(amount)
+
+
+def observe_batch(stage: str, size: int):
+    BATCH_SIZE.labels(stage).observe(size)
+
+
+def mark_worker_dead(pid: int):
+    """Drop a dead worker's live gauges (gunicorn `child_exit` hook)."""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid)
+
+
+def render_metrics() -> bytes:
+    if MULTIPROC_DIR:
+        # Fresh registry per scrape, as prometheus_client's multiprocess docs require
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+class RequestLatencyMiddleware:
+    """
+    Plain ASGI middleware timing each HTTP request up to its final body chunk,
+    so streamed responses (/api/export) are measured end to end. Avoids the
+    per-request task/queue overhead of BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        state = {"status": 500, "done": False}
+
+        def observe():
+            if state["done"]:
+                return
+            state["done"] = True
+            # Route template (/api/alerts/) rather than raw path keeps label cardinality bounded;
+            # the router writes it into this same scope dict during dispatch.
+            path = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_SECONDS.labels(scope["method"], path, str(state["status"])).observe(time.perf_counter() - start)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                observe()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Exceptions and client disconnects before the last chunk still count
+            observe()
+
+
+def instrument_app(app):
+    """
+    Attach request timing middleware and /metrics. The /debug/profiler routes
+    are only registered when MANIFEST_DEBUG_ENDPOINTS=1, since they are
+    unauthenticated and reveal source paths. Shared by the API (main.py) and
+    the crawler service (crawler/main.py).
+    """
+    from fastapi import Response
+    from fastapi.responses import PlainTextResponse
+
+    app.add_middleware(RequestLatencyMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+    if not DEBUG_ENDPOINTS:
+        return app
+
+    @app.post("/debug/profiler/start", include_in_schema=False)
+    def start_profiler(interval: float = 0.01):
+        profiler.start(interval=interval)
+        return {"running": profiler.running, "interval": profiler.interval}
+
+    @app.post("/debug/profiler/stop", include_in_schema=False)
+    def stop_profiler():
+        profiler.stop()
+        return {"running": profiler.running, "samples": profiler.total_samples}
+
+    @app.get("/debug/profiler", include_in_schema=False)
+    def dump_profiler(limit: int = 200):
+        # Collapsed-stack format, ready for flamegraph.pl / speedscope
+        return PlainTextResponse(profiler.collapsed(limit=limit))
+
+    return app
@@ -0,0 +1,133 @@
+# manifest/common/model_registry.py
+
+import gc
+import os
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from common.metrics import span
+
+# Comma-separated list of "kind:name" entries to load at startup, e.g.
+#   MANIFEST_WARMUP_MODELS="sentence_transformer:all-MiniLM-L6-v2,spacy:en_core_web_trf"
+WARMUP_ENV = "MANIFEST_WARMUP_MODELS"
+
+# Optional torch device for sentence-transformers ("cpu", "cuda", "cuda:1").
+# Unset keeps the library default, which picks CUDA when it is available.
+DEVICE_ENV = "MANIFEST_MODEL_DEVICE"
+
+
+def _load_sentence_transformer(name: str):
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(name, device=os.getenv(DEVICE_ENV) or None)
+
+
+def _load_spacy(name: str):
+    import spacy
+    try:
+        return spacy.load(name)
+    except OSError:
+        raise RuntimeError(f"Model '{name}' not found. Run: python -m spacy download {name}")
+
+
+# Sharing moves every CPU parameter/buffer storage into a shared-memory
+# mapping (/dev/shm). Forked workers then map the same physical pages, and as
+# the data lives outside the Python heap, refcount and GC writes to the
+# wrapping objects never copy it. It is only worth its /dev/shm footprint
+# before a fork, so only warm_up() does it; CUDA tensors are left as they are.
+
+def _share_sentence_transformer(model):
+    model.share_memory()
+
+
+def _share_spacy(nlp):
+    # Transformer pipelines (en_core_web_trf) wrap a torch model inside thinc
+    # PyTorchShims. CNN pipelines keep weights in large numpy buffers, which
+    # stay shared copy-on-write without any help.
+    for _, component in nlp.components:
+        model = getattr(component, "model", None)
+        if model is None or not hasattr(model, "walk"):
+            continue
+        for node in model.walk():
+            for shim in getattr(node, "shims", []):
+                torch_model = getattr(shim, "_model", None)
+                if hasattr(torch_model, "share_memory"):
+                    torch_model.share_memory()
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of heavyweight models. Nothing is imported or loaded
+    until a caller first asks for it; every later caller gets the same object.
+    """
+
+    def __init__(self):
+        self.loaders: Dict[str, Callable] = {
+            "sentence_transformer": _load_sentence_transformer,
+            "spacy": _load_spacy,
+        }
+        self.sharers: Dict[str, Callable] = {
+            "sentence_transformer": _share_sentence_transformer,
+            "spacy": _share_spacy,
+        }
+        self.models: Dict[tuple, object] = {}
+        self.lock = threading.Lock()
+
+    def get(self, kind: str, name: str):
+        key = (kind, name)
+        model = self.models.get(key)
+        if model is not None:
+            return model
+
+        with self.lock:
+            # Re-check: another thread may have finished loading while we waited
+            if key not in self.models:
+                with span(f"model_load.{kind}"):
+                    self.models[key] = self.loaders[kind](name)
+            return self.models[key]
+
+    def is_loaded(self, kind: str, name: str) -> bool:
+        return (kind, name) in self.models
+
+    def parse_spec(self, spec: str) -> Tuple[str, str]:
+        """Split a "kind:name" warm-up entry, rejecting malformed ones."""
+        kind, sep, name = spec.strip().partition(":")
+        if not sep or not name or kind not in self.loaders:
+            raise ValueError(
+                f"Invalid {WARMUP_ENV} entry {spec.strip()!r}: expected 'kind:name' "
+                f"with kind one of {', '.join(sorted(self.loaders))}"
+            )
+        return kind, name
+
+    def warm_up(self, specs: List[str] = None):
+        """
+        Eagerly load models and move their weights into shared memory. This
+        only saves memory when it runs in a pre-fork master, i.e. at import of
+        a module loaded by `gunicorn --preload`; workers then inherit the
+        shared weights instead of each loading a copy. (`uvicorn --workers`
+        spawns fresh interpreters, so nothing is shared.) Plain lazy loads
+        through get() stay on the heap.
+        """
+        if specs is None:
+            specs = [s for s in os.getenv(WARMUP_ENV, "").split(",") if s.strip()]
+
+        # Validate everything before loading anything, so a typo fails fast
+        parsed = [self.parse_spec(spec) for spec in specs]
+        for kind, name in parsed:
+            self.sharers[kind](self.get(kind, name))
+
+        if parsed:
+            # Move everything loaded so far out of GC tracking; otherwise the
+            # collector touches every object header and un-shares forked pages.
+            gc.collect()
+            gc.freeze()
+
+
+registry = ModelRegistry()
+
+
+def get_sentence_transformer(name: str = "all-MiniLM-L6-v2"):
+    return registry.get("sentence_transformer", name)
+
+
+def get_spacy(name: str = "en_core_web_trf"):
+    return registry.get("spacy", name)
@@ -0,0 +1,81 @@
+# manifest/common/profiler.py
+
+import os
+import sys
+import threading
+from collections import Counter
+
+# Below ~5ms the sampler thread starts competing with request threads for the GIL
+MIN_INTERVAL = 0.005
+
+
+class SamplingProfiler:
+    """
+    Minimal in-process sampling profiler. A daemon thread snapshots every
+    thread's stack at a fixed interval and aggregates collapsed stacks.
+    Costs nothing while stopped, so it can be toggled at runtime in production.
+    """
+
+    def __init__(self, max_depth: int = 64):
+        self.max_depth = max_depth
+        self.interval = 0.01
+        self.stacks = Counter()
+        self.total_samples = 0
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval: float = 0.01):
+        if self.running:
+            return
+        self.interval = max(interval, MIN_INTERVAL)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="manifest-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def reset(self):
+        with self._lock:
+            self.stacks.clear()
+            self.total_samples = 0
+
+    def collapsed(self, limit: int = 200) -> str:
+        """Return the hottest stacks as `frame;frame;frame count` lines."""
+        with self._lock:
+            top = self.stacks.most_common(limit)
+        return "\n".join(f"{stack} {n}" for stack, n in top)
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, frame in frames.items():
+                    if thread_id == own_id:
+                        continue
+                    self.stacks[self._collapse(frame)] += 1
+                self.total_samples += 1
+
+    def _collapse(self, frame) -> str:
+        parts = []
+        while frame is not None and len(parts) < self.max_depth:
+            code = frame.f_code
+            parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(parts))
+
+
+profiler = SamplingProfiler()
+
+if os.getenv("MANIFEST_PROFILER", "0") == "1":
+    profiler.start(interval=float(os.getenv("MANIFEST_PROFILER_INTERVAL", "0.01")))
@@ -4,6 +4,8 @@ import aiohttp
 import asyncio
 import async_timeout
 
+from common.metrics import timed, count
+
 HEADERS = {
     "User-Agent": "ManifestBot/1.0 (+https://3wh.dev/manifest)",
     "Accept-Language": "en-US,en;q=0.9",
@@ -21,6 +23,7 @@ class CrawlerAgent:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.session.close()
 
+    @timed("crawler.fetch")
     async def fetch(self, url):
         if self.session is None:
             self.session = aiohttp.ClientSession(headers=HEADERS)
@@ -29,16 +32,21 @@ class CrawlerAgent:
             async with async_timeout.timeout(self.timeout):
                 async with self.session.get(url, allow_redirects=True) as resp:
                     if resp.status == 200 and "text" in resp.headers.get("Content-Type", ""):
+                        count("fetch_ok")
                         return await resp.text()
                     else:
+                        count("fetch_rejected")
                         print(f"[!] Non-200 or non-text response: {url} ({resp.status})")
                         return None
         except asyncio.TimeoutError:
+            count("fetch_timeout")
             print(f"[!] Timeout fetching: {url}")
             return None
         except aiohttp.ClientError as e:
+            count("fetch_client_error")
             print(f"[!] Client error fetching {url}: {e}")
             return None
         except Exception as e:
+            count("fetch_unknown_error")
             print(f"[!] Unknown error fetching {url}: {e}")
             return None
@@ -8,8 +8,10 @@ from crawler.agent import CrawlerAgent
 from crawler.robots import RobotsHandler
 from crawler.hash_utils import ContentHasher
 from crawler.registry import CrawlRegistry
+from common.metrics import instrument_app, count
 
 app = FastAPI()
+instrument_app(app)  # /metrics, request timings, runtime profiler toggle
 
 SEED_URLS = [
     "https://example.com",
@@ -44,11 +46,13 @@ async def run_crawler():
             break
 
         if registry.has_recently_seen(url):
+            count("skip_recent")
             print(f"[•] Skipped (already crawled recently): {url}")
             continue
 
         print(f"[*] Checking robots.txt: {url}")
         if not await robots.is_allowed(url):
+            count("skip_robots")
             print(f"[x] Skipped (robots.txt disallow): {url}")
             continue
 
@@ -59,8 +63,10 @@ async def run_crawler():
             registry.mark_seen(url)
 
             if hasher.is_duplicate(content):
+                count("skip_duplicate")
                 print(f"[•] Duplicate content skipped: {url}")
             else:
+                count("unique_content")
                 print(f"[✓] Unique content: {url} ({len(content)} bytes)")
                 # ➜ Future: Send to parser/ → embed/ → vectorstore/
         else:
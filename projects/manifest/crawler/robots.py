@@ -4,15 +4,19 @@ import aiohttp
 import urllib.parse
 from urllib.robotparser import RobotFileParser
 
+from common.metrics import timed, count
+
 class RobotsHandler:
     def __init__(self, user_agent="ManifestBot"):
         self.parsers = {}
         self.user_agent = user_agent
 
+    @timed("crawler.robots")
     async def is_allowed(self, url):
         domain = self._get_domain(url)
 
         if domain not in self.parsers:
+            count("robots_cache_miss")
             robots_url = urllib.parse.urljoin(f"https://{domain}", "/robots.txt")
             parser = RobotFileParser()
             parser.set_url(robots_url)
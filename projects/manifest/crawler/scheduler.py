@@ -5,6 +5,8 @@ import time
 import urllib.parse
 from collections import deque, defaultdict
 
+from common.metrics import timed
+
 CRAWL_DELAY = 5  # seconds between hits to the same domain
 
 class Scheduler:
@@ -19,6 +21,7 @@ class Scheduler:
             if url not in self.queue:
                 self.queue.append(url)
 
+    @timed("scheduler.dequeue_wait")
     async def dequeue(self):
         """Pop a URL from the queue, respecting domain-based delay."""
         while self.queue:
@@ -0,0 +1,89 @@
+# manifest/export/stream.py
+
+import io
+import itertools
+import json
+from typing import Dict, Iterable, Iterator, List
+
+# Bump when exported columns change so downstream consumers can branch on it
+EXPORT_SCHEMA_VERSION = "1"
+
+
+def prime(batches: Iterator[List[Dict]]) -> Iterator[List[Dict]]:
+    """
+    Pull the first batch eagerly so connection and SQL errors are raised
+    while the endpoint can still answer with an error status, rather than
+    after a 200 has been sent and the body is cut short. The returned
+    generator closes `batches` when it finishes or is closed; callers that
+    abandon it before iterating must close `batches` themselves.
+    """
+    first = next(batches, None)
+
+    def stream():
+        try:
+            if first is not None:
+                yield first
+                yield from batches
+        finally:
+            batches.close()
+
+    return stream()
+
+
+def ndjson_stream(batches: Iterable[List[Dict]]) -> Iterator[bytes]:
+    """Encode row batches as newline-delimited JSON, one chunk per batch."""
+    for rows in batches:
+        yield "".join(json.dumps(row, default=str) + "\n" for row in rows).encode("utf-8")
+
+
+def arrow_schema(include_embedding: bool = False, with_distance: bool = False):
+    """
+    Build the Arrow export schema. Raises RuntimeError if pyarrow is not
+    installed; call it before opening any database cursor.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise RuntimeError("Arrow export requires pyarrow. Run: pip install pyarrow")
+
+    fields = [
+        pa.field("id", pa.string()),
+        pa.field("source", pa.string()),
+        pa.field("chunk_index", pa.int32()),
+        pa.field("text", pa.string()),
+        pa.field("timestamp", pa.timestamp("us", tz="UTC")),
+        pa.field("entities", pa.string()),  # JSON-encoded; entity dicts vary in shape
+    ]
+    if include_embedding:
+        fields.append(pa.field("embedding", pa.list_(pa.float32())))
+    if with_distance:
+        fields.append(pa.field("distance", pa.float64()))
+    return pa.schema(fields, metadata={"manifest_schema_version": EXPORT_SCHEMA_VERSION})
+
+
+def arrow_stream(batches: Iterable[List[Dict]], schema) -> Iterator[bytes]:
+    """
+    Encode row batches as an Arrow IPC stream using a schema from
+    arrow_schema(). Only one record batch is held in memory at a time; the
+    schema is fixed up front so every batch matches.
+    """
+    import pyarrow as pa
+
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    for rows in batches:
+        for row in rows:
+            row["id"] = str(row["id"])
+            row["entities"] = json.dumps(row.get("entities"), default=str)
+        writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+        yield drain()
+
+    writer.close()
+    yield drain()
@@ -2,14 +2,21 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 from vectorstore.pgvector import PGVectorStore
-from services.embedder import generate_embedding
+from export.stream import EXPORT_SCHEMA_VERSION, ndjson_stream, arrow_schema, arrow_stream, prime
+from services.embedder import generate_embedding, generate_embeddings
+from services.search_cache import cache_from_env, normalize_query
+from common.metrics import instrument_app
+from common.model_registry import registry
 
 from routes import alerts, digest
 
 app = FastAPI()
+instrument_app(app)  # /metrics, request timings, runtime profiler toggle
 
 # Root health check
 @app.get("/")
@@ -29,18 +36,126 @@ app.add_middleware(
 app.include_router(alerts.router, prefix="/api/alerts")
 app.include_router(digest.router, prefix="/api/digest")
 
-# Vector search endpoint
+# Vector search endpoint (connects lazily on first query)
 store = PGVectorStore()
+search_cache = cache_from_env()  # None when MANIFEST_SEARCH_CACHE_MB=0
+
+# Optional model warm-up (see MANIFEST_WARMUP_MODELS). Done at import, not in
+# the startup event, so under `gunicorn --preload` it runs once in the master
+# and forked workers share the loaded weights.
+registry.warm_up()
+
+@app.on_event("startup")
+def on_startup():
+    # Threads don't survive fork, so the listener starts per worker
+    if search_cache is not None:
+        # Invalidate cached results when any process ingests documents
+        store.watch_ingestion()
+
+MAX_PAGE_SIZE = 100
 
 class SearchQuery(BaseModel):
     query: str
-    top_k: int = 5
+    top_k: int = Field(5, ge=1, le=MAX_PAGE_SIZE)  # page size
+    cursor: Optional[str] = None  # next_cursor from the previous page
+    # Accept cached results of a near-identical query (see SearchCache); such
+    # responses carry "semantic_match" and cannot be paged
+    semantic: bool = False
 
 @app.post("/api/search")
 async def search_docs(search: SearchQuery):
+    # Bypass the cache while the ingestion listener is down: inserts from other
+    # processes would go unseen. Read the generation before searching so a
+    # concurrent insert marks this entry stale.
+    use_cache = search_cache is not None and store.listener_up
+    generation = store.generation
+
     try:
-        query_embedding = generate_embedding(search.query)
-        results = store.search(query_embedding, top_k=search.top_k)
-        return {"results": results}
+        query_embedding = None
+        if use_cache:
+            body, query_embedding = search_cache.lookup(search.query, search.top_k, search.cursor,
+                                                        generation, generate_embedding, search.semantic)
+            if body is not None:
+                return Response(content=body, media_type="application/json")
+
+        if query_embedding is None:
+            query_embedding = generate_embedding(search.query)
+        results, next_cursor = store.search_page(query_embedding, page_size=search.top_k, cursor=search.cursor,
+                                                 query_key=normalize_query(search.query))
+        if use_cache:
+            body = search_cache.put(search.query, search.top_k, search.cursor, generation,
+                                    results, next_cursor, query_embedding)
+            return Response(content=body, media_type="application/json")
+        return {"results": results, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+MAX_BATCH_QUERIES = 100
+MAX_BATCH_TOP_K = 50
+
+class BatchSearchQuery(BaseModel):
+    queries: List[str]
+    top_k: int = Field(5, ge=1, le=MAX_BATCH_TOP_K)
+
+@app.post("/api/search/batch")
+async def search_docs_batch(search: BatchSearchQuery):
+    if len(search.queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_QUERIES} queries per batch.")
+
+    try:
+        # Identical queries are embedded and searched once, then fanned back out
+        unique = list(dict.fromkeys(search.queries))
+        embeddings = generate_embeddings(unique) if unique else []
+        hits = dict(zip(unique, store.search_many(embeddings, top_k=search.top_k)))
+        return {"results": [{"query": q, "results": hits[q]} for q in search.queries]}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Bulk export for the export/ dashboard section; streamed from a server-side cursor
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+MAX_EXPORT_BATCH_SIZE = 10000
+
+@app.get("/api/export")
+def export_docs(query: Optional[str] = None, format: str = "ndjson", limit: Optional[int] = None,
+                include_embedding: bool = False, batch_size: int = 1000):
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{format}'. Use one of: {', '.join(EXPORT_MEDIA_TYPES)}")
+
+    if limit is not None and limit < 0:
+        raise HTTPException(status_code=400, detail="limit must be >= 0")
+    if not 0 < batch_size <= MAX_EXPORT_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"batch_size must be between 1 and {MAX_EXPORT_BATCH_SIZE}")
+
+    # Resolve the optional dependency before any connection is opened
+    schema = None
+    if format == "arrow":
+        try:
+            schema = arrow_schema(include_embedding=include_embedding, with_distance=bool(query))
+        except RuntimeError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+
+    rows = None
+    try:
+        query_embedding = generate_embedding(query) if query else None
+        rows = store.iter_documents(query_embedding, limit=limit,
+                                    include_embedding=include_embedding, batch_size=batch_size)
+        batches = prime(rows)
+        body = arrow_stream(batches, schema) if schema is not None else ndjson_stream(batches)
+    except Exception as e:
+        if rows is not None:
+            rows.close()  # release the dedicated connection and its open transaction
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f"attachment; filename=manifest-export.{format}",
+            "X-Manifest-Schema-Version": EXPORT_SCHEMA_VERSION,
+        },
+    )
@@ -1,18 +1,23 @@
 # manifest/parser/ner.py
 
-import spacy
 from typing import List, Dict
 
+from common.metrics import timed
+from common.model_registry import get_spacy
+
 class EntityExtractor:
     def __init__(self, model: str = "en_core_web_trf"):
         """
         :param model: SpaCy model to use (default: transformer-based NER)
         """
-        try:
-            self.nlp = spacy.load(model)
-        except OSError:
-            raise RuntimeError(f"Model '{model}' not found. Run: python -m spacy download {model}")
+        self.model_name = model
+
+    @property
+    def nlp(self):
+        # Loaded on first use and shared process-wide via the model registry
+        return get_spacy(self.model_name)
 
+    @timed("parser.ner")
     def extract_entities(self, text: str) -> List[Dict]:
         """
         Runs NER on input text and returns structured entities.
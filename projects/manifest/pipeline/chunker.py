@@ -2,11 +2,14 @@
 
 from typing import List
 
+from common.metrics import timed
+
 class TextChunker:
     def __init__(self, chunk_size=500, overlap=100):
         self.chunk_size = chunk_size
         self.overlap = overlap
 
+    @timed("pipeline.chunk")
     def chunk_text(self, text: str) -> List[str]:
         """
         Splits text into overlapping chunks.
@@ -1,18 +1,27 @@
 # manifest/pipeline/embed.py
 
-from sentence_transformers import SentenceTransformer
 from typing import List, Dict
 import uuid
 import datetime
 
+from common.metrics import timed, observe_batch
+from common.model_registry import get_sentence_transformer
+
 class Embedder:
     def __init__(self, model_name="all-MiniLM-L6-v2"):
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+
+    @property
+    def model(self):
+        # Loaded on first use and shared process-wide via the model registry
+        return get_sentence_transformer(self.model_name)
 
+    @timed("pipeline.embed_batch")
     def embed_chunks(self, chunks: List[str], source_url: str = "") -> List[Dict]:
         """
         Embeds each text chunk and returns list of dicts with vector and metadata.
         """
+        observe_batch("pipeline.embed_batch", len(chunks))
         vectors = self.model.encode(chunks, convert_to_numpy=True, normalize_embeddings=True)
         now = datetime.datetime.utcnow().isoformat()
 
@@ -4,12 +4,14 @@ from parser.ner import EntityExtractor
 from parser.idq import IDQScorer
 from pipeline.chunker import TextChunker
 from pipeline.embed import Embedder
+from common.metrics import span, timed
 
 from typing import Dict, List
 import re
 
 class IngestionRouter:
     def __init__(self, term_counts: Dict[str, int], total_docs: int):
+        # NER and embedder models are loaded lazily on first use
         self.ner = EntityExtractor()
         self.idq = IDQScorer(term_counts, total_docs)
         self.chunker = TextChunker()
@@ -19,6 +21,7 @@ class IngestionRouter:
         """Basic HTML tag stripping (can be replaced by BeautifulSoup later)."""
         return re.sub(r'<[^>]+>', '', html)
 
+    @timed("pipeline.process_document")
     def process_document(self, html: str, source_url: str) -> List[Dict]:
         """
         Full ETL: HTML → clean → NER → IDQ → chunk → embed
@@ -28,8 +31,9 @@ class IngestionRouter:
         entities = self.ner.extract_entities(text)
 
         # Apply IDQ scoring to each entity
-        for ent in entities:
-            ent["idq"] = self.idq.compute_idq(ent, context_len=len(text))
+        with span("parser.idq"):
+            for ent in entities:
+                ent["idq"] = self.idq.compute_idq(ent, context_len=len(text))
 
         # Add more logic later: summarization, relation linking, alert flagging
 
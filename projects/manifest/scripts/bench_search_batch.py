@@ -0,0 +1,110 @@
+# manifest/scripts/bench_search_batch.py
+#
+# Compares the two API search paths for N queries:
+#   sequential: N x (services.embedder.generate_embedding + PGVectorStore.search)
+#   batched:    one generate_embeddings call + one PGVectorStore.search_many
+# Embedding and database time are reported separately.
+#
+#   python -m scripts.bench_search_batch --queries 32 --rounds 5
+#
+# --store-only skips the embedder and uses random unit vectors, to isolate the
+# database round-trips (e.g. without API credentials). --populate N inserts N
+# random documents first; only point it at a scratch database.
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from services.embedder import generate_embedding, generate_embeddings
+from vectorstore.pgvector import PGVectorStore
+
+SAMPLE_QUERIES = [
+    "quantum computing breakthrough",
+    "new chip announced in California",
+    "fusion energy research",
+    "financial filing irregularities",
+    "supply chain disruption",
+    "open source language model release",
+    "regulatory action against crypto exchange",
+    "semiconductor export controls",
+]
+
+
+def random_unit(dim: int):
+    vec = [random.gauss(0, 1) for _ in range(dim)]
+    norm = sum(x * x for x in vec) ** 0.5
+    return [x / norm for x in vec]
+
+
+def populate(store, n: int, dim: int, batch: int = 1000):
+    now = datetime.now(timezone.utc)
+    for start in range(0, n, batch):
+        store.insert_documents([
+            {
+                "id": str(uuid4()),
+                "source": f"https://example.com/bench/{i // 10}",
+                "chunk_index": i % 10,
+                "text": f"benchmark chunk {i}",
+                "embedding": random_unit(dim),
+                "timestamp": now,
+            }
+            for i in range(start, min(start + batch, n))
+        ])
+
+
+def run_sequential(store, queries, top_k, embed):
+    embed_s = db_s = 0.0
+    for q in queries:
+        t = time.perf_counter()
+        vec = embed(q)
+        embed_s += time.perf_counter() - t
+        t = time.perf_counter()
+        store.search(vec, top_k=top_k)
+        db_s += time.perf_counter() - t
+    return embed_s, db_s
+
+
+def run_batched(store, queries, top_k, embed_many):
+    t = time.perf_counter()
+    vecs = embed_many(queries)
+    embed_s = time.perf_counter() - t
+    t = time.perf_counter()
+    store.search_many(vecs, top_k=top_k)
+    return embed_s, time.perf_counter() - t
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sequential vs batched search throughput")
+    parser.add_argument("--queries", type=int, default=32)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--dsn", default=None, help="defaults to PGVectorStore's DSN")
+    parser.add_argument("--store-only", action="store_true", help="random query vectors, no embedder")
+    parser.add_argument("--dim", type=int, default=384, help="vector size for --store-only/--populate")
+    parser.add_argument("--populate", type=int, default=0)
+    args = parser.parse_args()
+
+    store = PGVectorStore(args.dsn) if args.dsn else PGVectorStore()
+    if args.populate:
+        populate(store, args.populate, args.dim)
+
+    queries = [f"{SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]} #{i}" for i in range(args.queries)]
+    if args.store_only:
+        fixed = {q: random_unit(args.dim) for q in queries}
+        embed, embed_many = fixed.__getitem__, lambda qs: [fixed[q] for q in qs]
+    else:
+        embed, embed_many = generate_embedding, generate_embeddings
+
+    # Warm connection and planner caches before timing
+    run_batched(store, queries[:2], args.top_k, embed_many)
+
+    print(f"{'mode':<11} {'embed_ms':>9} {'db_ms':>9} {'total_ms':>9} {'queries/s':>10}")
+    for name, fn, embedder in (("sequential", run_sequential, embed), ("batched", run_batched, embed_many)):
+        rounds = [fn(store, queries, args.top_k, embedder) for _ in range(args.rounds)]
+        embed_ms = statistics.median(r[0] for r in rounds) * 1000
+        db_ms = statistics.median(r[1] for r in rounds) * 1000
+        total_ms = statistics.median(sum(r) for r in rounds) * 1000
+        print(f"{name:<11} {embed_ms:>9.1f} {db_ms:>9.1f} {total_ms:>9.1f} {args.queries / (total_ms / 1000):>10.1f}")
@@ -0,0 +1,158 @@
+# manifest/scripts/bench_startup.py
+#
+# Two measurements, each in fresh interpreters:
+#
+# 1. Cold start: import time and max RSS per service entry point.
+#      python -m scripts.bench_startup --runs 5
+#
+# 2. Forked workers (Linux only): load models either once in a pre-fork
+#    master ("preload", what `gunicorn --preload` + MANIFEST_WARMUP_MODELS
+#    does) or separately in each worker ("per-worker"), fork N workers, run
+#    one inference in each, and report every worker's PSS and USS from
+#    /proc/<pid>/smaps_rollup. PSS splits shared pages between the processes
+#    mapping them; USS counts only pages private to that worker.
+#      python -m scripts.bench_startup --workers 4 --warmup sentence_transformer:all-MiniLM-L6-v2
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter() - start
+
+# ru_maxrss is KiB on Linux, bytes on macOS
+scale = 1 if sys.platform == "darwin" else 1024
+print(json.dumps({{
+    "import_s": imported,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20,
+}}))
+"""
+
+
+def probe(module: str, runs: int):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {key: round(statistics.median(s[key] for s in samples), 4) for key in ("import_s", "max_rss_mb")}
+
+
+def read_smaps_rollup(pid: int):
+    """Return (pss_mb, uss_mb) for a process."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1])  # kB
+    uss = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return fields.get("Pss", 0) / 1024, uss / 1024
+
+
+def touch_models(registry, specs):
+    # One inference per model so lazily-initialised buffers are allocated too
+    for spec in specs:
+        kind, _, name = spec.partition(":")
+        model = registry.get(kind, name)
+        if kind == "sentence_transformer":
+            model.encode(["warm the worker"])
+        elif kind == "spacy":
+            model("Warm the worker.")
+
+
+def fork_workers(mode: str, specs, workers: int):
+    """Runs inside a fresh interpreter; prints one JSON line with per-worker results."""
+    from common.model_registry import registry
+
+    start = time.perf_counter()
+    if mode == "preload":
+        registry.warm_up(specs)
+    master_load_s = time.perf_counter() - start
+
+    # Each worker signals readiness, then blocks until every worker has been
+    # measured so that all of them are alive (and sharing) at measurement time.
+    ready_r, ready_w = os.pipe()
+    release_r, release_w = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            os.close(release_w)
+            t = time.perf_counter()
+            # per-worker: nothing preloaded, so touch_models does a plain lazy load
+            touch_models(registry, specs)
+            os.write(ready_w, json.dumps({"load_s": time.perf_counter() - t}).encode() + b"\n")
+            os.read(release_r, 1)
+            os._exit(0)
+        pids.append(pid)
+
+    os.close(ready_w)
+    with os.fdopen(ready_r) as ready:
+        loads = [json.loads(ready.readline()) for _ in pids]
+    results = []
+    for pid, load in zip(pids, loads):
+        pss, uss = read_smaps_rollup(pid)
+        results.append({"pid": pid, "pss_mb": pss, "uss_mb": uss, "load_s": load["load_s"]})
+
+    master_pss, master_uss = read_smaps_rollup(os.getpid())
+
+    os.write(release_w, b"x" * workers)
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    print(json.dumps({
+        "master_load_s": master_load_s, "master_pss_mb": master_pss,
+        "master_uss_mb": master_uss, "workers": results,
+    }))
+
+
+def run_fork_mode(mode: str, specs, workers: int):
+    out = subprocess.run(
+        [sys.executable, "-m", "scripts.bench_startup", "--fork-probe", mode,
+         "--workers", str(workers), "--warmup", *specs],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup time / worker memory benchmark")
+    parser.add_argument("--modules", nargs="+", default=["main", "crawler.main", "pipeline.router"])
+    parser.add_argument("--warmup", nargs="*", default=[], help="kind:name model specs to load")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=0, help="fork N workers and report PSS/USS")
+    parser.add_argument("--fork-probe", choices=["preload", "per-worker"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.fork_probe:
+        fork_workers(args.fork_probe, args.warmup, args.workers)
+        sys.exit(0)
+
+    if args.workers:
+        if not args.warmup:
+            parser.error("--workers needs at least one --warmup model spec")
+        print(f"{'mode':<11} {'proc':<7} {'load_s':>8} {'pss_mb':>9} {'uss_mb':>9}")
+        for mode in ("preload", "per-worker"):
+            r = run_fork_mode(mode, args.warmup, args.workers)
+            print(f"{mode:<11} {'master':<7} {r['master_load_s']:>8.2f} {r['master_pss_mb']:>9.1f} {r['master_uss_mb']:>9.1f}")
+            for i, w in enumerate(r["workers"]):
+                print(f"{mode:<11} {'w' + str(i):<7} {w['load_s']:>8.2f} {w['pss_mb']:>9.1f} {w['uss_mb']:>9.1f}")
+            total = r["master_pss_mb"] + sum(w["pss_mb"] for w in r["workers"])
+            print(f"{mode:<11} {'total':<7} {'':>8} {total:>9.1f}")
+        sys.exit(0)
+
+    print(f"{'module':<20} {'import_s':>10} {'max_rss_mb':>11}")
+    for module in args.modules:
+        r = probe(module, args.runs)
+        print(f"{module:<20} {r['import_s']:>10} {r['max_rss_mb']:>11}")
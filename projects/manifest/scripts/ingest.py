@@ -3,20 +3,20 @@
 import os
 from dotenv import load_dotenv
 from vectorstore.pgvector import PGVectorStore
-from sentence_transformers import SentenceTransformer
+from common.model_registry import get_sentence_transformer
 from uuid import uuid4
 
 load_dotenv()
 
 # You can swap in OpenAI or keep this fast local model for now
-EMBEDDING_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
 
 store = PGVectorStore()
 
 def ingest_text(title: str, text: str):
     # Chunking (can be made more advanced)
     chunks = [text[i:i+500] for i in range(0, len(text), 500)]
-    embeddings = EMBEDDING_MODEL.encode(chunks)
+    embeddings = get_sentence_transformer(EMBEDDING_MODEL_NAME).encode(chunks)
 
     documents = [
         {
@@ -1,8 +1,6 @@
 import os
-import torch
 import psycopg2
-import numpy as np
-from sentence_transformers import SentenceTransformer, util
+from common.model_registry import get_sentence_transformer
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,8 +13,6 @@ DB_CONFIG = {
     "dbname": os.getenv("POSTGRES_DB", "manifest"),
 }
 
-model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-
 def get_connection():
     return psycopg2.connect(**DB_CONFIG)
 
@@ -39,6 +35,7 @@ def query_db(embedding, top_k=5):
     return results
 
 def search(query, top_k=5):
+    model = get_sentence_transformer("all-MiniLM-L6-v2")
     embedding = model.encode(query, convert_to_tensor=True, normalize_embeddings=True)
     return query_db(embedding, top_k)
 
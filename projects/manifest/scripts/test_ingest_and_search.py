@@ -2,7 +2,7 @@
 
 from pipeline.router import IngestionRouter
 from vectorstore.pgvector import PGVectorStore
-from sentence_transformers import SentenceTransformer
+from common.model_registry import get_sentence_transformer
 
 # ---------- 🔧 Setup ----------
 
@@ -40,8 +40,8 @@ store.insert_documents(docs)
 query_text = "new chip in quantum computing"
 print(f"\n[→] Semantic search: {query_text}")
 
-# Generate embedding for the query
-model = SentenceTransformer("all-MiniLM-L6-v2")
+# Generate embedding for the query (reuses the model the router already loaded)
+model = get_sentence_transformer("all-MiniLM-L6-v2")
 query_vec = model.encode(query_text, normalize_embeddings=True).tolist()
 
 # Perform search
@@ -2,9 +2,18 @@
 
 import openai
 
+from common.metrics import timed, observe_batch
+
 def generate_embedding(text: str) -> list[float]:
+    return generate_embeddings([text])[0]
+
+@timed("api.embed_query")
+def generate_embeddings(texts: list[str]) -> list[list[float]]:
+    """Embed several texts in a single API call, preserving input order."""
+    observe_batch("api.embed_query", len(texts))
     response = openai.Embedding.create(
         model="text-embedding-ada-002",
-        input=[text]
+        input=texts
     )
-    return response['data'][0]['embedding']
+    data = sorted(response['data'], key=lambda d: d['index'])
+    return [d['embedding'] for d in data]
@@ -0,0 +1,230 @@
+# services/search_cache.py
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from common.metrics import CACHE_BYTES, CACHE_ENTRIES, CACHE_LOOKUPS
+
+CACHE_NAME = "search"
+
+# Per-entry bookkeeping beyond the stored bytes: the entry dict, key tuple,
+# object headers and OrderedDict node. tracemalloc on CPython 3.11 puts it at
+# ~450 bytes; rounded up so the byte limit errs on the safe side.
+ENTRY_OVERHEAD = 1024
+
+# Embedding matrix rows are allocated in blocks to avoid per-put reallocation
+MATRIX_GROWTH = 256
+
+
+def normalize_query(text: str) -> str:
+    """Case- and whitespace-insensitive cache key for a query string."""
+    return " ".join(text.lower().split())
+
+
+def encode_payload(results_json: bytes, next_cursor: Optional[str], semantic_match: Optional[Dict] = None) -> bytes:
+    """Assemble the /api/search response body from cached parts."""
+    body = b'{"results": ' + results_json + b', "next_cursor": ' + json.dumps(next_cursor).encode("utf-8")
+    if semantic_match is not None:
+        body += b', "semantic_match": ' + json.dumps(semantic_match).encode("utf-8")
+    return body + b"}"
+
+
+class SearchCache:
+    """
+    LRU cache of /api/search responses, bounded by the bytes it holds rather
+    than by entry count. Results are stored already serialized, so the size
+    accounting is exact up to a fixed per-entry overhead and hits skip JSON
+    encoding.
+
+    Entries are tagged with the vector store's ingestion generation and are
+    treated as misses once it moves on, so new documents are never hidden.
+
+    Exact lookups are keyed by (normalized query, top_k, cursor) and skip the
+    embedder entirely. With semantic_threshold set, a first-page lookup that
+    opts in (semantic=True) can also be served from a cached query whose
+    embedding has cosine similarity at or above the threshold (the embedding
+    call is paid, the vector scan is not). Such a response carries a
+    "semantic_match" object naming the cached query and its similarity; its
+    distances were measured from that query, and its next_cursor is None
+    because the cached cursor cannot page the caller's query.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, semantic_threshold: Optional[float] = None):
+        self.max_bytes = max_bytes
+        self.semantic_threshold = semantic_threshold
+        self.entries: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self.current_bytes = 0
+        self.lock = threading.Lock()
+
+        # Semantic index: one unit-norm row per first-page entry. row_keys maps
+        # row -> entry key (None for free rows); each entry records its row.
+        self.matrix: Optional[np.ndarray] = None
+        self.row_keys: List[Optional[tuple]] = []
+        self.row_top_k = np.zeros(0, dtype=np.int64)
+        self.row_generation = np.zeros(0, dtype=np.int64)
+        self.row_live = np.zeros(0, dtype=bool)
+        self.free_rows: List[int] = []
+
+    def lookup(self, query: str, top_k: int, cursor: Optional[str], generation: int,
+               embed: Callable[[str], List[float]],
+               semantic: bool = False) -> Tuple[Optional[bytes], Optional[List[float]]]:
+        """
+        Returns (body, embedding). body is the serialized response on a hit,
+        None on a miss. embedding is the query embedding if the semantic
+        lookup had to compute it, so the caller can reuse it for the search.
+        Exactly one outcome (hit, semantic_hit, stale or miss) is recorded.
+        """
+        key = (normalize_query(query), top_k, cursor)
+        with self.lock:
+            entry = self.entries.get(key)
+            outcome = "miss"
+            if entry is not None and entry["generation"] != generation:
+                self._evict(key)
+                outcome = "stale"
+            elif entry is not None:
+                self.entries.move_to_end(key)
+                CACHE_LOOKUPS.labels(CACHE_NAME, "hit").inc()
+                return encode_payload(entry["results_json"], entry["next_cursor"]), None
+
+        embedding = None
+        if semantic and self.semantic_threshold is not None and cursor is None:
+            # Embed outside the lock; it is a network/model call
+            embedding = embed(query)
+            body = self._get_similar(embedding, top_k, generation)
+            if body is not None:
+                CACHE_LOOKUPS.labels(CACHE_NAME, "semantic_hit").inc()
+                return body, embedding
+
+        CACHE_LOOKUPS.labels(CACHE_NAME, outcome).inc()
+        return None, embedding
+
+    def put(self, query: str, top_k: int, cursor: Optional[str], generation: int,
+            results: List[Dict], next_cursor: Optional[str], embedding: Optional[List[float]] = None) -> bytes:
+        """Cache a response and return its serialized body."""
+        results_json = json.dumps(results, default=str).encode("utf-8")
+        body = encode_payload(results_json, next_cursor)
+
+        key = (normalize_query(query), top_k, cursor)
+        vec = None
+        if self.semantic_threshold is not None and cursor is None and embedding is not None:
+            vec = _unit(embedding)
+        size = len(results_json) + len(next_cursor or "") + len(key[0]) + ENTRY_OVERHEAD
+        size += vec.nbytes if vec is not None else 0
+        if size > self.max_bytes:
+            return body
+
+        with self.lock:
+            if key in self.entries:
+                self._evict(key)
+            entry = {
+                "generation": generation, "results_json": results_json,
+                "next_cursor": next_cursor, "size": size, "row": None,
+            }
+            if vec is not None:
+                entry["row"] = self._add_row(key, vec, top_k, generation)
+            self.entries[key] = entry
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                self._evict(next(iter(self.entries)))
+            self._report()
+        return body
+
+    def clear(self):
+        with self.lock:
+            for key in list(self.entries):
+                self._evict(key)
+            self._report()
+
+    def _get_similar(self, embedding: List[float], top_k: int, generation: int) -> Optional[bytes]:
+        query = _unit(embedding)
+        with self.lock:
+            if self.matrix is None or self.matrix.shape[1] != query.shape[0]:
+                return None
+            n = len(self.row_keys)
+            usable = self.row_live[:n] & (self.row_top_k[:n] == top_k) & (self.row_generation[:n] == generation)
+            if not usable.any():
+                return None
+
+            sims = self.matrix[:n] @ query
+            sims[~usable] = -np.inf
+            best = int(np.argmax(sims))
+            if sims[best] < self.semantic_threshold:
+                return None
+
+            key = self.row_keys[best]
+            self.entries.move_to_end(key)
+            match = {"query": key[0], "similarity": round(float(sims[best]), 4)}
+            return encode_payload(self.entries[key]["results_json"], None, match)
+
+    def _add_row(self, key, vec: np.ndarray, top_k: int, generation: int) -> Optional[int]:
+        if self.matrix is None:
+            self.matrix = np.zeros((MATRIX_GROWTH, vec.shape[0]), dtype=np.float32)
+            self._grow_row_arrays(MATRIX_GROWTH)
+        if vec.shape[0] != self.matrix.shape[1]:
+            return None  # embedder changed dimension; skip semantic indexing
+
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            row = len(self.row_keys)
+            self.row_keys.append(None)
+            if row >= self.matrix.shape[0]:
+                grown = np.zeros((self.matrix.shape[0] + MATRIX_GROWTH, self.matrix.shape[1]), dtype=np.float32)
+                grown[:self.matrix.shape[0]] = self.matrix
+                self.matrix = grown
+                self._grow_row_arrays(self.matrix.shape[0])
+
+        self.matrix[row] = vec
+        self.row_keys[row] = key
+        self.row_top_k[row] = top_k
+        self.row_generation[row] = generation
+        self.row_live[row] = True
+        return row
+
+    def _grow_row_arrays(self, size: int):
+        for name in ("row_top_k", "row_generation", "row_live"):
+            old = getattr(self, name)
+            grown = np.zeros(size, dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    def _evict(self, key):
+        entry = self.entries.pop(key)
+        self.current_bytes -= entry["size"]
+        row = entry["row"]
+        if row is not None:
+            self.row_live[row] = False
+            self.row_keys[row] = None
+            self.free_rows.append(row)
+        self._report()
+
+    def _report(self):
+        CACHE_BYTES.labels(CACHE_NAME).set(self.current_bytes)
+        CACHE_ENTRIES.labels(CACHE_NAME).set(len(self.entries))
+
+
+def _unit(embedding) -> np.ndarray:
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+def cache_from_env() -> Optional[SearchCache]:
+    """
+    MANIFEST_SEARCH_CACHE_MB (default 64, 0 disables) bounds memory;
+    MANIFEST_SEARCH_CACHE_SEMANTIC (e.g. 0.97) enables semantic reuse for
+    requests that ask for it.
+    """
+    max_mb = float(os.getenv("MANIFEST_SEARCH_CACHE_MB", "64"))
+    if max_mb <= 0:
+        return None
+    threshold = os.getenv("MANIFEST_SEARCH_CACHE_SEMANTIC")
+    return SearchCache(
+        max_bytes=int(max_mb * 2**20),
+        semantic_threshold=float(threshold) if threshold else None,
+    )